@@ -1,13 +1,16 @@
 """Utility functions for the component docs page."""
 
+import ast
+import functools
 import inspect
-import re
+import io
+import textwrap
+import tokenize
 from typing import Any, Type
 
 from reflex.base import Base
 from reflex.components.component import Component
 
-from pcweb.component_list import component_list, not_ready_components
 from pcweb.components.sidebar import SidebarItem
 from pcweb.pages.docs.component_lib import *
 from pcweb.templates.docpage import docheader, docpage, subheader
@@ -28,25 +31,28 @@ class Prop(Base):
     description: str
 
 
+# Cache of the props declared directly on each component class.
+_PROPS_CACHE: dict[Type[Component], list[Prop]] = {}
+
+
 class Source(Base):
     """Parse the source code of a component."""
 
     # The component to parse.
     component: Type[Component]
 
-    # The source code.
-    code: list[str] = []
+    # The source code, read on first use.
+    code: str = ""
 
-    def __init__(self, *args, **kwargs):
-        """Initialize the source code parser."""
-        super().__init__(*args, **kwargs)
+    def get_code(self) -> str:
+        """Get the source code of the component, reading it if needed.
 
-        # Get the source code.
-        self.code = [
-            line
-            for line in inspect.getsource(self.component).splitlines()
-            if len(line) > 0
-        ]
+        Returns:
+            The dedented source code of the component.
+        """
+        if not self.code:
+            self.code = textwrap.dedent(inspect.getsource(self.component))
+        return self.code
 
     def get_docs(self) -> str:
         """Get the docstring of the component.
@@ -62,11 +68,15 @@ class Source(Base):
         Returns:
             A dictionary of the props and their descriptions.
         """
-        props = self._get_props()
+        props = []
 
-        parent_cls = self.component.__bases__[0]
-        if parent_cls != rx.Component:
-            props += Source(component=parent_cls).get_props()
+        # Walk up the first-base chain, stopping at the base component.
+        cls = self.component
+        while cls is not rx.Component and issubclass(cls, rx.Component):
+            if cls not in _PROPS_CACHE:
+                _PROPS_CACHE[cls] = get_source(cls)._get_props()
+            props += _PROPS_CACHE[cls]
+            cls = cls.__bases__[0]
 
         return props
 
@@ -81,46 +91,41 @@ class Source(Base):
 
         # Get the props for this component.
         props = self.component.get_props()
-
-        comments = []
-        # Loop through the source code.
-        for i, line in enumerate(self.code):
-            # Check if we've reached the functions.
-            reached_functions = re.search("def ", line)
-            if reached_functions:
-                # We've reached the functions, so stop.
-                break
-
-            # Get comments for prop
-            if line.strip().startswith("#"):
-                comments.append(line)
-                continue
-
-            # Check if this line has a prop.
-            match = re.search("\w+:", line)
-            if match is None:
-                # This line doesn't have a var, so continue.
+        if not props:
+            # No props, so there's no need to read the source.
+            return out
+
+        # Get the full-line comments, keyed by line number.
+        code = self.get_code()
+        comments = Source.get_comment_lines(code)
+
+        # Get the fields of the component.
+        fields = self.component.get_fields()
+
+        # Loop through the annotated fields of the class.
+        class_def = ast.parse(code).body[0]
+        for node in class_def.body:
+            if not isinstance(node, ast.AnnAssign) or not isinstance(
+                node.target, ast.Name
+            ):
                 continue
 
             # Get the prop.
-            prop = match.group(0).strip(":")
+            prop = node.target.id
             if prop not in props:
                 # This isn't a prop, so continue.
                 continue
 
-            # redundant check just to double-check line above prop is a comment
-            comment_above = self.code[i - 1].strip()
-            assert comment_above.startswith(
-                "#"
-            ), f"Expected comment, got {comment_above}"
-
-            # Get the comment for this prop.
-            comment = Source.get_comment(comments)
-            # reset comments
-            comments.clear()
+            # Get the comment block directly above the prop.
+            prop_comments = []
+            lineno = node.lineno - 1
+            while lineno in comments:
+                prop_comments.insert(0, comments[lineno])
+                lineno -= 1
+            comment = "".join(prop_comments)
 
             # Get the type of the prop.
-            type_ = self.component.get_fields()[prop].outer_type_
+            type_ = fields[prop].outer_type_
 
             # Add the prop to the output.
             out.append(
@@ -135,8 +140,38 @@ class Source(Base):
         return out
 
     @staticmethod
-    def get_comment(comments: list[str]):
-        return "".join([comment.strip().strip("#") for comment in comments])
+    def get_comment_lines(code: str) -> dict[int, str]:
+        """Get the comments that take up a full line of the source.
+
+        Args:
+            code: The source code to tokenize.
+
+        Returns:
+            A mapping from line number to comment text, without the "#".
+        """
+        return {
+            token.start[0]: token.string.strip().strip("#")
+            for token in tokenize.generate_tokens(io.StringIO(code).readline)
+            if token.type == tokenize.COMMENT and token.line.lstrip().startswith("#")
+        }
+
+
+# Cache of parsed sources, keyed by component class.
+_SOURCE_CACHE: dict[Type[Component], Source] = {}
+
+
+def get_source(component: Type[Component]) -> Source:
+    """Get the source parser for a component, creating it on first use.
+
+    Args:
+        component: The component class to parse.
+
+    Returns:
+        The cached source parser for the component.
+    """
+    if component not in _SOURCE_CACHE:
+        _SOURCE_CACHE[component] = Source(component=component)
+    return _SOURCE_CACHE[component]
 
 
 # Mapping from types to colors.
@@ -154,20 +189,29 @@ TYPE_COLORS = {
 }
 
 
-def prop_docs(prop: Prop) -> list[rx.Component]:
-    """Generate the docs for a prop."""
-    # Get the type of the prop.
-    type_ = prop.type_
-    if rx.utils.types._issubclass(prop.type_, rx.Var):
+@functools.lru_cache(maxsize=None)
+def _resolve_type_name(type_: Any) -> tuple[str, str]:
+    """Get the display name and color of a prop type.
+
+    Args:
+        type_: The type of the prop.
+
+    Returns:
+        The name of the type and its color.
+    """
+    if rx.utils.types._issubclass(type_, rx.Var):
         # For vars, get the type of the var.
         type_ = rx.utils.types.get_args(type_)[0]
-    try:
-        type_ = type_.__name__
-    except AttributeError:
-        print(type_)
+    type_ = getattr(type_, "__name__", None) or str(type_)
 
     # Get the color of the prop.
-    color = TYPE_COLORS.get(type_, "gray")
+    return type_, TYPE_COLORS.get(type_, "gray")
+
+
+def prop_docs(prop: Prop) -> list[rx.Component]:
+    """Generate the docs for a prop."""
+    # Get the type of the prop and its color.
+    type_, color = _resolve_type_name(prop.type_)
 
     # Return the docs for the prop.
     return [
@@ -177,187 +221,94 @@ def prop_docs(prop: Prop) -> list[rx.Component]:
     ]
 
 
+# Mapping from lowercase component names to their example renderers.
+_RENDERERS = {
+    name[len("render_") :]: fn
+    for name, fn in globals().items()
+    if name.startswith("render_") and callable(fn)
+}
+
+
 def get_examples(component: str) -> rx.Component:
-    return eval(f"render_{component.lower()}()")
+    return _RENDERERS[component.lower()]()
 
 
 EVENTS = {
-    "on_focus": {
-        "description": "Function or event handler called when the element (or some element inside of it) receives focus. For example, it is called when the user clicks on a text input."
-    },
-    "on_blur": {
-        "description": "Function or event handler called when focus has left the element (or left some element inside of it). For example, it is called when the user clicks outside of a focused text input."
-    },
-    "on_change": {
-        "description": "Function or event handler called when the value of an element has changed. For example, it is called when the user types into a text input each keystoke triggers the on change."
-    },
-    "on_click": {
-        "description": "Function or event handler called when the user clicks on an element. For example, it’s called when the user clicks on a button."
-    },
-    "on_context_menu": {
-        "description": "Function or event handler called when the user right-clicks on an element. For example, it is called when the user right-clicks on a button."
-    },
-    "on_double_click": {
-        "description": "Function or event handler called when the user double-clicks on an element. For example, it is called when the user double-clicks on a button."
-    },
-    "on_mouse_up": {
-        "description": "Function or event handler called when the user releases a mouse button on an element. For example, it is called when the user releases the left mouse button on a button."
-    },
-    "on_mouse_down": {
-        "description": "Function or event handler called when the user presses a mouse button on an element. For example, it is called when the user presses the left mouse button on a button."
-    },
-    "on_mouse_enter": {
-        "description": "Function or event handler called when the user’s mouse enters an element. For example, it is called when the user’s mouse enters a button."
-    },
-    "on_mouse_leave": {
-        "description": "Function or event handler called when the user’s mouse leaves an element. For example, it is called when the user’s mouse leaves a button."
-    },
-    "on_mouse_move": {
-        "description": "Function or event handler called when the user moves the mouse over an element. For example, it’s called when the user moves the mouse over a button."
-    },
-    "on_mouse_out": {
-        "description": "Function or event handler called when the user’s mouse leaves an element. For example, it is called when the user’s mouse leaves a button."
-    },
-    "on_mouse_over": {
-        "description": "Function or event handler called when the user’s mouse enters an element. For example, it is called when the user’s mouse enters a button."
-    },
-    "on_scroll": {
-        "description": "Function or event handler called when the user scrolls the page. For example, it is called when the user scrolls the page down."
-    },
-    "on_submit": {
-        "description": "Function or event handler called when the user submits a form. For example, it is called when the user clicks on a submit button."
-    },
-    "on_cancel": {
-        "description": "Function or event handler called when the user cancels a form. For example, it is called when the user clicks on a cancel button."
-    },
-    "on_edit": {
-        "description": "Function or event handler called when the user edits a form. For example, it is called when the user clicks on a edit button."
-    },
-    "on_change_start": {
-        "description": "Function or event handler called when the user starts selecting a new value(By dragging or clicking)."
-    },
-    "on_change_end": {
-        "description": "Function or event handler called when the user is done selecting a new value(By dragging or clicking)."
-    },
-    "on_complete": {
-        "description": "Called when the user completes a form. For example, it’s called when the user clicks on a complete button."
-    },
-    "on_error": {
-        "description": "The on_error event handler is called when the user encounters an error in a form. For example, it’s called when the user clicks on a error button."
-    },
-    "on_load": {
-        "description": "The on_load event handler is called when the user loads a form. For example, it is called when the user clicks on a load button."
-    },
-    "on_esc": {
-        "description": "The on_esc event handler is called when the user presses the escape key. For example, it is called when the user presses the escape key."
-    },
-    "on_open": {
-        "description": "The on_open event handler is called when the user opens a form. For example, it is called when the user clicks on a open button."
-    },
-    "on_close": {
-        "description": "The on_close event handler is called when the user closes a form. For example, it is called when the user clicks on a close button."
-    },
-    "on_close_complete": {
-        "description": "The on_close_complete event handler is called when the user closes a form. For example, it is called when the user clicks on a close complete button."
-    },
-    "on_overlay_click": {
-        "description": "The on_overlay_click event handler is called when the user clicks on an overlay. For example, it is called when the user clicks on a overlay button."
-    },
-    "on_key_down": {
-        "description": "The on_key_down event handler is called when the user presses a key."
-    },
-    "on_key_up": {
-        "description": "The on_key_up event handler is called when the user releases a key."
-    },
-    "on_ready": {
-        "description": "The on_ready event handler is called when the script is ready to be executed."
-    },
-    "on_mount": {
-        "description": "The on_mount event handler is called when the component is loaded on the page."
-    },
-    "on_unmount": {
-        "description": "The on_unmount event handler is called when the component is removed from the page. This handler is only called during navigation, not when the page is refreshed."
-    },
-    "on_input": {
-        "description": "The on_input event handler is called when the editor receives input from the user. It receives the raw browser event as an argument.",
-    },
-    "on_resize_editor": {
-        "description": "The on_resize_editor event handler is called when the editor is resized. It receives the height and previous height as arguments.",
-    },
-    "on_copy": {
-        "description": "The on_copy event handler is called when the user copies text from the editor. It receives the clipboard data as an argument.",
-    },
-    "on_cut": {
-        "description": "The on_cut event handler is called when the user cuts text from the editor. It receives the clipboard data as an argument.",
-    },
-    "on_paste": {
-        "description": "The on_paste event handler is called when the user pastes text into the editor. It receives the clipboard data and max character count as arguments.",
-    },
-    "toggle_code_view": {
-        "description": "The toggle_code_view event handler is called when the user toggles code view. It receives a boolean whether code view is active.",
-    },
-    "toggle_full_screen": {
-        "description": "The toggle_full_screen event handler is called when the user toggles full screen. It receives a boolean whether full screen is active.",
-    },
-    "on_cell_activated": {
-        "description": "The on_cell_activated event handler is called when the user activate a cell from the data editor. It receive the coordinates of the cell.",
-    },
-    "on_cell_clicked": {
-        "description": "The on_cell_clicked event handler is called when the user click on a cell of the data editor. It receive the coordinates of the cell.",
-    },
-    "on_cell_context_menu": {
-        "description": "The on_cell_context_menu event handler is called when the user right-click on a cell of the data editor. It receives the coordinates of the cell.",
-    },
-    "on_cell_edited": {
-        "description": "The on_cell_edited event handler is called when the user modify the content of a cell. It receives the coordinates of the cell and the modified content.",
-    },
-    "on_group_header_clicked": {
-        "description": "The on_group_header_clicked event handler is called when the user left-click on a group header of the data editor. It receive the index and the data of the group header.",
-    },
-    "on_group_header_context_menu": {
-        "description": "The on_group_header_context_menu event handler is called when the user right-click on a group header of the data editor. It receive the index and the data of the group header.",
-    },
-    "on_group_header_renamed": {
-        "description": "The on_group_header_context_menu event handler is called when the user rename a group header of the data editor. It receive the index and the modified content of the group header.",
-    },
-    "on_header_clicked": {
-        "description": "The on_header_clicked event handler is called when the user left-click a header of the data editor. It receive the index and the content of the header.",
-    },
-    "on_header_context_menu": {
-        "description": "The on_header_context_menu event handler is called when the user right-click a header of the data editor. It receives the index and the content of the header. ",
-    },
-    "on_header_menu_click": {
-        "description": "The on_header_menu_click event handler is called when the user click on the menu button of the header. (menu header not implemented yet)",
-    },
-    "on_item_hovered": {
-        "description": "The on_item_hovered event handler is called when the user hover on an item of the data editor.",
-    },
-    "on_delete": {
-        "description": "The on_delete event handler is called when the user delete a cell of the data editor.",
-    },
-    "on_finished_editing": {
-        "description": "The on_finished_editing event handler is called when the user finish an editing, regardless of if the value changed or not.",
-    },
-    "on_row_appended": {
-        "description": "The on_row_appended event handler is called when the user add a row to the data editor.",
-    },
-    "on_selection_cleared": {
-        "description": "The on_selection_cleared event handler is called when the user unselect a region of the data editor.",
-    },
-    "on_column_resize": {
-        "description": "The on_column_resize event handler is called when the user try to resize a column from the data editor."
-    },
+    "on_focus": "Function or event handler called when the element (or some element inside of it) receives focus. For example, it is called when the user clicks on a text input.",
+    "on_blur": "Function or event handler called when focus has left the element (or left some element inside of it). For example, it is called when the user clicks outside of a focused text input.",
+    "on_change": "Function or event handler called when the value of an element has changed. For example, it is called when the user types into a text input each keystoke triggers the on change.",
+    "on_click": "Function or event handler called when the user clicks on an element. For example, it’s called when the user clicks on a button.",
+    "on_context_menu": "Function or event handler called when the user right-clicks on an element. For example, it is called when the user right-clicks on a button.",
+    "on_double_click": "Function or event handler called when the user double-clicks on an element. For example, it is called when the user double-clicks on a button.",
+    "on_mouse_up": "Function or event handler called when the user releases a mouse button on an element. For example, it is called when the user releases the left mouse button on a button.",
+    "on_mouse_down": "Function or event handler called when the user presses a mouse button on an element. For example, it is called when the user presses the left mouse button on a button.",
+    "on_mouse_enter": "Function or event handler called when the user’s mouse enters an element. For example, it is called when the user’s mouse enters a button.",
+    "on_mouse_leave": "Function or event handler called when the user’s mouse leaves an element. For example, it is called when the user’s mouse leaves a button.",
+    "on_mouse_move": "Function or event handler called when the user moves the mouse over an element. For example, it’s called when the user moves the mouse over a button.",
+    "on_mouse_out": "Function or event handler called when the user’s mouse leaves an element. For example, it is called when the user’s mouse leaves a button.",
+    "on_mouse_over": "Function or event handler called when the user’s mouse enters an element. For example, it is called when the user’s mouse enters a button.",
+    "on_scroll": "Function or event handler called when the user scrolls the page. For example, it is called when the user scrolls the page down.",
+    "on_submit": "Function or event handler called when the user submits a form. For example, it is called when the user clicks on a submit button.",
+    "on_cancel": "Function or event handler called when the user cancels a form. For example, it is called when the user clicks on a cancel button.",
+    "on_edit": "Function or event handler called when the user edits a form. For example, it is called when the user clicks on a edit button.",
+    "on_change_start": "Function or event handler called when the user starts selecting a new value(By dragging or clicking).",
+    "on_change_end": "Function or event handler called when the user is done selecting a new value(By dragging or clicking).",
+    "on_complete": "Called when the user completes a form. For example, it’s called when the user clicks on a complete button.",
+    "on_error": "The on_error event handler is called when the user encounters an error in a form. For example, it’s called when the user clicks on a error button.",
+    "on_load": "The on_load event handler is called when the user loads a form. For example, it is called when the user clicks on a load button.",
+    "on_esc": "The on_esc event handler is called when the user presses the escape key. For example, it is called when the user presses the escape key.",
+    "on_open": "The on_open event handler is called when the user opens a form. For example, it is called when the user clicks on a open button.",
+    "on_close": "The on_close event handler is called when the user closes a form. For example, it is called when the user clicks on a close button.",
+    "on_close_complete": "The on_close_complete event handler is called when the user closes a form. For example, it is called when the user clicks on a close complete button.",
+    "on_overlay_click": "The on_overlay_click event handler is called when the user clicks on an overlay. For example, it is called when the user clicks on a overlay button.",
+    "on_key_down": "The on_key_down event handler is called when the user presses a key.",
+    "on_key_up": "The on_key_up event handler is called when the user releases a key.",
+    "on_ready": "The on_ready event handler is called when the script is ready to be executed.",
+    "on_mount": "The on_mount event handler is called when the component is loaded on the page.",
+    "on_unmount": "The on_unmount event handler is called when the component is removed from the page. This handler is only called during navigation, not when the page is refreshed.",
+    "on_input": "The on_input event handler is called when the editor receives input from the user. It receives the raw browser event as an argument.",
+    "on_resize_editor": "The on_resize_editor event handler is called when the editor is resized. It receives the height and previous height as arguments.",
+    "on_copy": "The on_copy event handler is called when the user copies text from the editor. It receives the clipboard data as an argument.",
+    "on_cut": "The on_cut event handler is called when the user cuts text from the editor. It receives the clipboard data as an argument.",
+    "on_paste": "The on_paste event handler is called when the user pastes text into the editor. It receives the clipboard data and max character count as arguments.",
+    "toggle_code_view": "The toggle_code_view event handler is called when the user toggles code view. It receives a boolean whether code view is active.",
+    "toggle_full_screen": "The toggle_full_screen event handler is called when the user toggles full screen. It receives a boolean whether full screen is active.",
+    "on_cell_activated": "The on_cell_activated event handler is called when the user activate a cell from the data editor. It receive the coordinates of the cell.",
+    "on_cell_clicked": "The on_cell_clicked event handler is called when the user click on a cell of the data editor. It receive the coordinates of the cell.",
+    "on_cell_context_menu": "The on_cell_context_menu event handler is called when the user right-click on a cell of the data editor. It receives the coordinates of the cell.",
+    "on_cell_edited": "The on_cell_edited event handler is called when the user modify the content of a cell. It receives the coordinates of the cell and the modified content.",
+    "on_group_header_clicked": "The on_group_header_clicked event handler is called when the user left-click on a group header of the data editor. It receive the index and the data of the group header.",
+    "on_group_header_context_menu": "The on_group_header_context_menu event handler is called when the user right-click on a group header of the data editor. It receive the index and the data of the group header.",
+    "on_group_header_renamed": "The on_group_header_context_menu event handler is called when the user rename a group header of the data editor. It receive the index and the modified content of the group header.",
+    "on_header_clicked": "The on_header_clicked event handler is called when the user left-click a header of the data editor. It receive the index and the content of the header.",
+    "on_header_context_menu": "The on_header_context_menu event handler is called when the user right-click a header of the data editor. It receives the index and the content of the header. ",
+    "on_header_menu_click": "The on_header_menu_click event handler is called when the user click on the menu button of the header. (menu header not implemented yet)",
+    "on_item_hovered": "The on_item_hovered event handler is called when the user hover on an item of the data editor.",
+    "on_delete": "The on_delete event handler is called when the user delete a cell of the data editor.",
+    "on_finished_editing": "The on_finished_editing event handler is called when the user finish an editing, regardless of if the value changed or not.",
+    "on_row_appended": "The on_row_appended event handler is called when the user add a row to the data editor.",
+    "on_selection_cleared": "The on_selection_cleared event handler is called when the user unselect a region of the data editor.",
+    "on_column_resize": "The on_column_resize event handler is called when the user try to resize a column from the data editor.",
 }
 
 
+# Event triggers that are not documented per component.
+_EXCLUDED_TRIGGERS = frozenset({"on_drop"})
+
+# The base component and the event triggers shared by every component.
+_BASE_COMPONENT = rx.Component.create()
+_BASE_TRIGGERS = frozenset(_BASE_COMPONENT.get_event_triggers().keys())
+
+
 # Docs page
 def component_docs(component):
     from pcweb.pages.docs.api_reference.event_triggers import event_triggers
 
-    src = Source(component=component)
+    src = get_source(component)
+    props_list = src.get_props()
     props = []
 
-    if len(src.get_props()) > 0:
+    if len(props_list) > 0:
         props = [
             rx.accordion(
                 rx.accordion_item(
@@ -375,10 +326,7 @@ def component_docs(component):
                                     )
                                 ),
                                 rx.tbody(
-                                    *[
-                                        rx.tr(*prop_docs(prop))
-                                        for prop in src.get_props()
-                                    ]
+                                    *[rx.tr(*prop_docs(prop)) for prop in props_list]
                                 ),
                             ),
                             background_color="rgb(255, 255, 255)",
@@ -413,11 +361,12 @@ def component_docs(component):
 
     triggers = []
 
-    trig = []
-    default_triggers = rx.Component.create().get_event_triggers().keys()
-    for event in component().get_event_triggers().keys():
-        if event not in default_triggers and event not in ("on_drop",):
-            trig.append(event)
+    component_triggers = tuple(component().get_event_triggers().keys())
+    trig = [
+        event
+        for event in component_triggers
+        if event not in _BASE_TRIGGERS and event not in _EXCLUDED_TRIGGERS
+    ]
 
     if trig:
         specific_triggers = rx.accordion_item(
@@ -432,10 +381,9 @@ def component_docs(component):
                             rx.accordion_icon(),
                             rx.code(event),
                         ),
-                        rx.accordion_panel(rx.text(EVENTS[event]["description"])),
+                        rx.accordion_panel(rx.text(EVENTS.get(event, ""))),
                     )
-                    for event in component().get_event_triggers().keys()
-                    if event not in default_triggers and event not in ("on_drop",)
+                    for event in trig
                 ],
             ),
             border_color="rgb(255, 255, 255)",
@@ -501,7 +449,6 @@ def multi_docs(path, component_list):
     @docpage(set_path=path)
     def out():
         components = [component_docs(component) for component in component_list]
-        coming_soon_components = [c.__name__ for c in not_ready_components]
 
         name = component_list[0].__name__
         return rx.box(